@@ -0,0 +1,97 @@
+from pydantic import BaseModel, Field
+
+type FacetValues = list[tuple[str, int]]
+type TrendList = list[tuple[str, int]]
+
+# FTS phrases mapped to the facet and display value they tag a posting with.
+# Phrases are tokenized like postings, so "on site" also matches "On-site";
+# words that are common in plain English are only matched in qualified forms
+FACET_TERMS: dict[str, dict[str, str]] = {
+    "work_mode": {
+        "remote": "Remote",
+        "onsite": "Onsite",
+        "on site": "Onsite",
+        "in office": "Onsite",
+        "in person": "Onsite",
+        "hybrid": "Hybrid",
+    },
+    "location": {
+        "nyc": "New York",
+        "new york": "New York",
+        "sf": "San Francisco",
+        "san francisco": "San Francisco",
+        "bay area": "San Francisco",
+        "boston": "Boston",
+        "seattle": "Seattle",
+        "austin": "Austin",
+        "chicago": "Chicago",
+        "denver": "Denver",
+        "los angeles": "Los Angeles",
+        "toronto": "Toronto",
+        "vancouver": "Vancouver",
+        "london": "London",
+        "berlin": "Berlin",
+        "amsterdam": "Amsterdam",
+        "paris": "Paris",
+        "dublin": "Dublin",
+        "europe": "Europe",
+        "usa": "USA",
+        "canada": "Canada",
+        "uk": "UK",
+    },
+    "technology": {
+        "python": "Python",
+        "django": "Django",
+        "rust": "Rust",
+        "golang": "Go",
+        "java": "Java",
+        "kotlin": "Kotlin",
+        "scala": "Scala",
+        "javascript": "JavaScript",
+        "typescript": "TypeScript",
+        "reactjs": "React",
+        "react js": "React",
+        "react native": "React",
+        "vue": "Vue",
+        "angular": "Angular",
+        "node js": "Node.js",
+        "nodejs": "Node.js",
+        "ruby": "Ruby",
+        "rails": "Rails",
+        "elixir": "Elixir",
+        "haskell": "Haskell",
+        "clojure": "Clojure",
+        "php": "PHP",
+        "swiftui": "Swift",
+        "postgres": "PostgreSQL",
+        "postgresql": "PostgreSQL",
+        "mysql": "MySQL",
+        "kafka": "Kafka",
+        "graphql": "GraphQL",
+        "kubernetes": "Kubernetes",
+        "docker": "Docker",
+        "terraform": "Terraform",
+        "aws": "AWS",
+        "gcp": "GCP",
+        "azure": "Azure",
+        "pytorch": "PyTorch",
+        "llm": "LLM",
+    },
+}
+
+
+# Negated phrases mapped to the facet term they cancel; a posting whose only
+# mentions of the term are negated is not tagged with it
+NEGATED_TERMS: dict[str, str] = {
+    "no remote": "remote",
+    "not remote": "remote",
+    "non remote": "remote",
+}
+
+
+class Facets(BaseModel):
+    total: int = Field(description="Number of postings matching the query")
+    values: dict[str, FacetValues] = Field(
+        default_factory=dict,
+        description="Top (value, posting count) pairs keyed by facet name",
+    )
@@ -1,11 +1,13 @@
+import json
 import sqlite3
-from sqlite3 import Connection
-from typing import TypeAlias, Self
 from datetime import datetime, timedelta
+from sqlite3 import Connection
+from typing import Self
 
+from hackerjobs.Facets import FACET_TERMS, NEGATED_TERMS, Facets, FacetValues
 from hackerjobs.Posting import Posting
 
-ResultList: TypeAlias = list[Posting]
+type ResultList = list[Posting]
 
 
 class JobPostingIndex:
@@ -44,6 +46,7 @@ class JobPostingIndex:
 
         # Check if we already have the enhanced schema
         if self._has_enhanced_schema():
+            self._initialize_facets()
             return  # Schema is already up to date
 
         # Create main postings table
@@ -99,8 +102,147 @@ class JobPostingIndex:
             "CREATE INDEX IF NOT EXISTS idx_postings_created_at ON postings(created_at)"
         )
 
+        self._initialize_facets()
         self.conn.commit()
 
+    def _initialize_facets(self) -> None:
+        """Create missing facet tables - writes nothing when they are up to date"""
+        assert self.conn is not None
+
+        retag = False
+
+        if not self._has_table("facet_terms"):
+            self.conn.execute("""
+                CREATE TABLE facet_terms (
+                    term TEXT PRIMARY KEY,
+                    facet TEXT NOT NULL,
+                    value TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+        facet_terms = {
+            (term, facet, value)
+            for facet, terms in FACET_TERMS.items()
+            for term, value in terms.items()
+        }
+        cursor = self.conn.execute("SELECT term, facet, value FROM facet_terms")
+        if set(cursor.fetchall()) != facet_terms:
+            self.conn.execute("DELETE FROM facet_terms")
+            self.conn.executemany(
+                "INSERT INTO facet_terms (term, facet, value) VALUES (?, ?, ?)",
+                facet_terms,
+            )
+            retag = True
+
+        # Phrases that cancel a facet term, e.g. "no remote" for "remote"
+        if not self._has_table("facet_negations"):
+            self.conn.execute("""
+                CREATE TABLE facet_negations (
+                    term TEXT PRIMARY KEY,
+                    negates TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+        cursor = self.conn.execute("SELECT term, negates FROM facet_negations")
+        if set(cursor.fetchall()) != set(NEGATED_TERMS.items()):
+            self.conn.execute("DELETE FROM facet_negations")
+            self.conn.executemany(
+                "INSERT INTO facet_negations (term, negates) VALUES (?, ?)",
+                NEGATED_TERMS.items(),
+            )
+            retag = True
+
+        # Facet values each posting is tagged with, kept in step by index_postings
+        if not self._has_table("posting_tags"):
+            self.conn.execute("""
+                CREATE TABLE posting_tags (
+                    posting_rowid INTEGER NOT NULL,
+                    facet TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (posting_rowid, facet, value)
+                ) WITHOUT ROWID
+            """)
+            retag = True
+
+        self._initialize_trends()
+
+        if retag:
+            self.conn.execute("DELETE FROM posting_tags")
+            self._tag_postings(min_rowid=0)
+            self.conn.commit()
+
+    def _initialize_trends(self) -> None:
+        """Create the trend word cache if it is missing"""
+        assert self.conn is not None
+
+        # Number of postings in this thread mentioning each trended word
+        if not self._has_table("term_counts"):
+            self.conn.execute("""
+                CREATE TABLE term_counts (
+                    term TEXT PRIMARY KEY,
+                    postings INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self.conn.commit()
+
+    def _tag_postings(self, min_rowid: int) -> None:
+        """Tag postings from min_rowid onwards with the facet phrases they contain"""
+        assert self.conn is not None
+
+        # CROSS JOIN keeps facet_terms as the outer loop so each phrase is one
+        # FTS lookup seeking straight to min_rowid; the postings join drops
+        # stale FTS rows
+        self.conn.execute(
+            """
+            INSERT OR IGNORE INTO posting_tags (posting_rowid, facet, value)
+            SELECT fts.rowid, t.facet, t.value
+            FROM facet_terms t
+            CROSS JOIN postings_fts fts
+            JOIN postings p ON p.rowid = fts.rowid
+            WHERE fts.text MATCH '"' || t.term || '"' AND fts.rowid >= ?
+            """,
+            (min_rowid,),
+        )
+
+        # Untag postings whose every mention of a term is inside a negated
+        # phrase; highlight() marks each match, so counting the markers
+        # counts the occurrences of a phrase in one posting
+        occurrences = """(
+            SELECT length(h) - length(replace(h, char(1), '')) FROM (
+                SELECT highlight(postings_fts, 1, char(1), '') AS h
+                FROM postings_fts
+                WHERE postings_fts.text MATCH {phrases}
+                AND postings_fts.rowid = fts.rowid
+            )
+        )"""
+        term_occurrences = occurrences.format(phrases="'\"' || t.term || '\"'")
+        negated_occurrences = occurrences.format(phrases="n.phrases")
+        self.conn.execute(
+            f"""
+            WITH negated AS (
+                SELECT negates, group_concat('"' || term || '"', ' OR ') AS phrases
+                FROM facet_negations GROUP BY negates
+            )
+            DELETE FROM posting_tags
+            WHERE (posting_rowid, facet, value) IN (
+                SELECT fts.rowid, t.facet, t.value
+                FROM negated n
+                JOIN facet_terms t ON t.term = n.negates
+                CROSS JOIN postings_fts fts
+                WHERE fts.text MATCH n.phrases AND fts.rowid >= ?
+                AND {term_occurrences} <= {negated_occurrences}
+            )
+            """,
+            (min_rowid,),
+        )
+
+    def _has_table(self, name: str) -> bool:
+        assert self.conn is not None
+        cursor = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (name,)
+        )
+        return cursor.fetchone() is not None
+
     def _has_enhanced_schema(self) -> bool:
         """Check if we have the enhanced schema with timestamp column"""
         assert self.conn is not None
@@ -120,6 +262,10 @@ class JobPostingIndex:
     def drop_table(self) -> None:
         """Drop all tables - use with caution as this deletes all data"""
         assert self.conn is not None
+        self.conn.execute("DROP TABLE IF EXISTS facet_terms")
+        self.conn.execute("DROP TABLE IF EXISTS facet_negations")
+        self.conn.execute("DROP TABLE IF EXISTS posting_tags")
+        self.conn.execute("DROP TABLE IF EXISTS term_counts")
         # Drop FTS table first (due to triggers)
         self.conn.execute("DROP TABLE IF EXISTS postings_fts")
         self.conn.execute("DROP TABLE IF EXISTS postings")
@@ -129,6 +275,14 @@ class JobPostingIndex:
         assert self.conn is not None
 
         valid_postings = [job for job in postings if job]
+        ids = json.dumps([job.id for job in valid_postings])
+
+        # Rows about to be replaced lose their tags
+        cursor = self.conn.execute(
+            "SELECT rowid FROM postings WHERE id IN (SELECT value FROM json_each(?))",
+            (ids,),
+        )
+        replaced = cursor.fetchall()
 
         sql = (
             "INSERT OR REPLACE INTO postings "
@@ -139,6 +293,20 @@ class JobPostingIndex:
             ((job.id, job.text, job.by, job.timestamp) for job in valid_postings),
         )
 
+        cursor = self.conn.execute(
+            "SELECT MIN(rowid) FROM postings "
+            "WHERE id IN (SELECT value FROM json_each(?))",
+            (ids,),
+        )
+        min_rowid = cursor.fetchone()[0]
+
+        self.conn.execute("DELETE FROM term_counts")
+        self.conn.executemany(
+            "DELETE FROM posting_tags WHERE posting_rowid = ?", replaced
+        )
+        if min_rowid is not None:
+            self._tag_postings(min_rowid)
+
         self.conn.commit()
 
     def search(
@@ -173,3 +341,98 @@ class JobPostingIndex:
             Posting(id=result[0], text=result[1], by=result[2], timestamp=result[3])
             for result in results
         ]
+
+    def facets(
+        self,
+        query_text: str,
+        days: int = 30,
+        top: int = 10,
+    ) -> Facets:
+        """Count matching postings per facet value without fetching the postings"""
+        assert self.conn is not None
+
+        cutoff_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+
+        matched = """
+        WITH matched AS (
+            SELECT p.rowid AS rowid FROM postings p
+            JOIN postings_fts fts ON p.rowid = fts.rowid
+            WHERE fts.text MATCH ? AND p.timestamp >= ?
+        )
+        """
+
+        cursor = self.conn.execute(
+            f"{matched} SELECT COUNT(*) FROM matched",
+            (query_text, cutoff_timestamp),
+        )
+        total = cursor.fetchone()[0]
+
+        query = f"""
+        {matched}
+        SELECT facet, value, postings FROM (
+            SELECT t.facet, t.value, COUNT(*) AS postings,
+                ROW_NUMBER() OVER (
+                    PARTITION BY t.facet ORDER BY COUNT(*) DESC, t.value
+                ) AS facet_rank
+            FROM matched m
+            JOIN posting_tags t ON t.posting_rowid = m.rowid
+            GROUP BY t.facet, t.value
+        )
+        WHERE facet_rank <= ? ORDER BY facet, facet_rank
+        """
+
+        cursor = self.conn.execute(query, (query_text, cutoff_timestamp, top))
+
+        values: dict[str, FacetValues] = {facet: [] for facet in FACET_TERMS}
+        for facet, value, postings in cursor.fetchall():
+            values[facet].append((value, postings))
+
+        return Facets(total=total, values=values)
+
+    def thread_period(self) -> str | None:
+        """Month the thread started in, taken from its earliest posting"""
+        assert self.conn is not None
+
+        cursor = self.conn.execute(
+            "SELECT strftime('%Y-%m', MIN(timestamp), 'unixepoch') FROM postings"
+        )
+        period: str | None = cursor.fetchone()[0]
+        return period
+
+    def mentions(self, term: str) -> int:
+        """Number of postings mentioning a word, cached until the next index"""
+        assert self.conn is not None
+
+        term = term.strip().lower()
+        if not term:
+            raise ValueError("Trend term must not be empty")
+
+        self._initialize_trends()
+
+        cursor = self.conn.execute(
+            "SELECT postings FROM term_counts WHERE term = ?", (term,)
+        )
+        cached = cursor.fetchone()
+        if cached is not None:
+            postings: int = cached[0]
+            return postings
+
+        # Quoting as a phrase lets the FTS tokenizer split and normalise
+        # the word the same way it did the postings (node.js, café, c++)
+        phrase = '"' + term.replace('"', '""') + '"'
+        cursor = self.conn.execute(
+            """
+            SELECT COUNT(*) FROM postings p
+            JOIN postings_fts fts ON p.rowid = fts.rowid
+            WHERE fts.text MATCH ?
+            """,
+            (phrase,),
+        )
+        postings = cursor.fetchone()[0]
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO term_counts (term, postings) VALUES (?, ?)",
+            (term, postings),
+        )
+        self.conn.commit()
+        return postings
@@ -1,11 +1,18 @@
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
+from rich.table import Table
 
+from hackerjobs.Facets import Facets, TrendList
 from hackerjobs.Posting import Posting
 
 URL = "https://news.ycombinator.com/item"
 
+FACET_TITLES = {
+    "work_mode": "🏠 Work Mode",
+    "location": "📍 Location",
+    "technology": "🛠️ Technology",
+}
+
 
 def print_search_query_info(
     query_text: str, result_count: int, console: Console
@@ -58,3 +65,47 @@ def print_search_results(
 
     console.print(table)
     console.print()  # Add some spacing
+
+
+def print_facets(facets: Facets, console: Console) -> None:
+    """Print facet counts for a query as one Rich table per facet."""
+    if not facets.total:
+        console.print("[dim]No results found for your search query.[/dim]")
+        return
+
+    for facet, values in facets.values.items():
+        table = Table(show_header=True, header_style="bold blue")
+        table.add_column(FACET_TITLES.get(facet, facet), style="white")
+        table.add_column("Postings", style="cyan", justify="right")
+        table.add_column("Share", style="yellow", justify="right")
+
+        for value, count in values:
+            share = f"{count / facets.total:.0%}"
+            table.add_row(value, str(count), share)
+
+        console.print(table)
+    console.print()
+
+
+def print_trend(term: str, trend: TrendList, console: Console) -> None:
+    """Print per-thread posting counts for a term using Rich styling."""
+    if not trend:
+        console.print("[dim]No indexed threads to show a trend for.[/dim]")
+        return
+
+    table = Table(
+        title=f'[bold blue]📈 Postings mentioning "{term}"[/bold blue]',
+        show_header=True,
+        header_style="bold blue",
+    )
+    table.add_column("📅 Thread", style="yellow", justify="center")
+    table.add_column("Postings", style="cyan", justify="right")
+    table.add_column("", style="green")
+
+    peak = max(count for _, count in trend) or 1
+    for period, count in trend:
+        bar = "█" * round(count / peak * 30)
+        table.add_row(period, str(count), bar)
+
+    console.print(table)
+    console.print()
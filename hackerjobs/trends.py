@@ -0,0 +1,26 @@
+from collections import Counter
+from pathlib import Path
+
+from hackerjobs.Facets import TrendList
+from hackerjobs.JobPostingIndex import JobPostingIndex
+
+INDEX_GLOB = "hackernews_job_postings_*.db"
+
+
+def thread_trend(term: str, threads: int, index_dir: Path = Path(".")) -> TrendList:
+    """Count postings mentioning a word in each locally indexed thread.
+
+    Every index file holds one thread, labelled by the month it started in.
+    Returns the latest `threads` threads, oldest first.
+    """
+    counts: Counter[str] = Counter()
+    for index_file in index_dir.glob(INDEX_GLOB):
+        with JobPostingIndex(str(index_file)) as index:
+            if not index.table_exists():
+                continue
+            period = index.thread_period()
+            if period is None:
+                continue
+            counts[period] += index.mentions(term)
+
+    return sorted(counts.items())[-threads:]
@@ -6,10 +6,26 @@ from rich.console import Console
 from hackerjobs.HNSearch import get_latest_hiring_post_id
 from hackerjobs.JobPostingFetcher import JobPostingFetcher
 from hackerjobs.JobPostingIndex import JobPostingIndex
-from hackerjobs.output import print_search_results, print_search_query_info
+from hackerjobs.output import (
+    print_facets,
+    print_search_query_info,
+    print_search_results,
+    print_trend,
+)
+from hackerjobs.trends import thread_trend
 
 URL = "https://news.ycombinator.com/item"
 DEFAULT_QUERY_TEXT = "python AND remote"
+TREND_THREADS = 12
+
+
+def show_trend(term: str, console: Console) -> None:
+    try:
+        trend = thread_trend(term, TREND_THREADS)
+    except ValueError as error:
+        console.print(f"[red]❌ {error}[/red]")
+        return
+    print_trend(term, trend, console)
 
 
 async def main(
@@ -18,9 +34,16 @@ async def main(
     query_text: str,
     search_count: int,
     days: int,
+    facets: bool,
+    trend_term: str | None,
 ) -> None:
     console = Console()
 
+    # Trends only read threads that are already indexed locally
+    if trend_term is not None and job_posting_id is None:
+        show_trend(trend_term, console)
+        return
+
     if job_posting_id is None:
         with console.status(
             "[bold blue]Searching for latest job posting...[/bold blue]", spinner="dots"
@@ -51,12 +74,24 @@ async def main(
             )
             console.print(success_msg)
 
-        search_results = index.search(
-            query_text=query_text, days=days, limit=search_count, sort_by_time=True
-        )
+        # Bring index files from older versions up to date with the facet tables
+        index.initialize()
+
+        if facets:
+            facet_counts = index.facets(query_text=query_text, days=days)
+
+            print_search_query_info(query_text, facet_counts.total, console)
+            print_facets(facet_counts, console)
+        elif trend_term is None:
+            search_results = index.search(
+                query_text=query_text, days=days, limit=search_count, sort_by_time=True
+            )
 
-        print_search_query_info(query_text, len(search_results), console)
-        print_search_results(search_results, console, show_age=True)
+            print_search_query_info(query_text, len(search_results), console)
+            print_search_results(search_results, console, show_age=True)
+
+    if trend_term is not None:
+        show_trend(trend_term, console)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -94,6 +129,18 @@ def parse_arguments() -> argparse.Namespace:
         default=30,
         help="Filter postings from last N days (default: 30)",
     )
+    parser.add_argument(
+        "-f",
+        "--facets",
+        action="store_true",
+        help="Show counts by work mode, location and technology instead of postings",
+    )
+    parser.add_argument(
+        "-t",
+        "--trend",
+        default=None,
+        help="Show postings mentioning a word across the locally indexed threads",
+    )
 
     return parser.parse_args()
 
@@ -107,5 +154,7 @@ if __name__ == "__main__":
             args.query_text,
             args.search_count,
             args.days,
+            args.facets,
+            args.trend,
         )
     )
@@ -1,3 +1,5 @@
+import pytest
+
 from hackerjobs.JobPostingIndex import JobPostingIndex
 from hackerjobs.Posting import Posting
 
@@ -187,3 +189,189 @@ def test_search_days_filter_strict() -> None:
         assert len(search_results) == 1
         assert "1" in search_results_ids  # 1 day ago
         assert "2" not in search_results_ids  # 2 days ago (filtered out)
+
+
+def test_facets() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(POSTINGS)
+
+        facets = index.facets("python")
+
+        assert facets.total == 4
+        assert facets.values["work_mode"] == [("Remote", 2), ("Onsite", 1)]
+        assert facets.values["location"] == [("Boston", 1)]
+        assert facets.values["technology"] == [("Python", 4)]
+
+
+def test_facets_days_filter() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(POSTINGS)
+
+        # Only postings 1 and 2 are within the last 3 days
+        facets = index.facets("python", days=3)
+
+        assert facets.total == 2
+        assert facets.values["work_mode"] == [("Remote", 2)]
+        assert facets.values["location"] == []
+
+
+def test_facets_phrases() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(
+            [
+                Posting(
+                    id="1",
+                    text="Backend engineer - On-site, New York",
+                    by="a",
+                    timestamp=int(__import__("time").time()),
+                ),
+                Posting(
+                    id="2",
+                    text="We react quickly; York, PA office",
+                    by="b",
+                    timestamp=int(__import__("time").time()),
+                ),
+                Posting(
+                    id="3",
+                    text="Platform engineer - Onsite only, no remote",
+                    by="c",
+                    timestamp=int(__import__("time").time()),
+                ),
+                Posting(
+                    id="4",
+                    text="Data engineer - Remote (US), not remote outside the US",
+                    by="d",
+                    timestamp=int(__import__("time").time()),
+                ),
+            ]
+        )
+
+        facets = index.facets("engineer OR react")
+
+        assert facets.total == 4
+        assert facets.values["work_mode"] == [("Onsite", 2), ("Remote", 1)]
+        assert facets.values["location"] == [("New York", 1)]
+        assert facets.values["technology"] == []
+
+
+def test_index_postings_retags_replaced_postings() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(POSTINGS)
+
+        index.index_postings(
+            [
+                Posting(
+                    id="1",
+                    text="Python developer - Onsite",
+                    by="user1",
+                    timestamp=POSTINGS[0].timestamp,
+                )
+            ]
+        )
+
+        facets = index.facets("python")
+
+        assert facets.total == 4
+        assert facets.values["work_mode"] == [("Onsite", 2), ("Remote", 1)]
+
+
+def test_initialize_existing_database() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(POSTINGS)
+
+        # Index files created before facets only have the postings tables
+        assert index.conn is not None
+        for table in ("facet_terms", "facet_negations", "posting_tags", "term_counts"):
+            index.conn.execute(f"DROP TABLE {table}")
+        index.conn.commit()
+
+        index.initialize()
+        facets = index.facets("python")
+
+        assert facets.total == 4
+        assert facets.values["work_mode"] == [("Remote", 2), ("Onsite", 1)]
+
+        # Once up to date, initialize leaves the database untouched
+        changes = index.conn.total_changes
+        index.initialize()
+        assert index.conn.total_changes == changes
+
+
+def test_mentions() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(POSTINGS)
+
+        assert index.mentions("Python") == 4
+        assert index.mentions("remote") == 2
+        assert index.mentions("rust") == 0
+
+        # New postings refresh the cached counts
+        index.index_postings(
+            [
+                Posting(
+                    id="6",
+                    text="Rust backend",
+                    by="user6",
+                    timestamp=POSTINGS[0].timestamp,
+                )
+            ]
+        )
+        assert index.mentions("rust") == 1
+
+        # Replacing a posting refreshes them as well
+        index.index_postings(
+            [
+                Posting(
+                    id="6",
+                    text="Go backend",
+                    by="user6",
+                    timestamp=POSTINGS[0].timestamp,
+                )
+            ]
+        )
+        assert index.mentions("rust") == 0
+
+
+def test_mentions_tokenizes_term() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        index.index_postings(
+            [
+                Posting(
+                    id="1",
+                    text="Node.js and C++ developer, full-time, café on site",
+                    by="user1",
+                    timestamp=1714608000,
+                )
+            ]
+        )
+
+        assert index.mentions("node.js") == 1
+        assert index.mentions("Full-Time") == 1
+        assert index.mentions("café") == 1
+        assert index.mentions("c++") == 1
+        assert index.mentions("golang") == 0
+
+        with pytest.raises(ValueError):
+            index.mentions("  ")
+
+
+def test_thread_period() -> None:
+    with JobPostingIndex(":memory:") as index:
+        index.initialize()
+        assert index.thread_period() is None
+
+        # Comments posted after the month ends stay with the thread
+        index.index_postings(
+            [
+                Posting(id="1", text="Rust", by="user1", timestamp=1717027200),
+                Posting(id="2", text="Rust", by="user2", timestamp=1717286400),
+            ]
+        )
+        assert index.thread_period() == "2024-05"
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from hackerjobs.JobPostingIndex import JobPostingIndex
+from hackerjobs.Posting import Posting
+from hackerjobs.trends import thread_trend
+
+
+def test_thread_trend(tmp_path: Path) -> None:
+    threads = {
+        1: [
+            Posting(id="1", text="Rust developer", by="a", timestamp=1714608000),
+            # Posted to the May thread after the month ended
+            Posting(id="2", text="Rust and Python", by="b", timestamp=1717286400),
+        ],
+        2: [
+            Posting(id="3", text="Rust and Python", by="c", timestamp=1717372800),
+            Posting(id="4", text="Python developer", by="d", timestamp=1717459200),
+        ],
+    }
+    for thread_id, postings in threads.items():
+        index_file = tmp_path / f"hackernews_job_postings_{thread_id}.db"
+        with JobPostingIndex(str(index_file)) as index:
+            index.initialize()
+            index.index_postings(postings)
+
+    assert thread_trend("rust", 12, tmp_path) == [("2024-05", 2), ("2024-06", 1)]
+    assert thread_trend("python", 12, tmp_path) == [("2024-05", 1), ("2024-06", 2)]
+    assert thread_trend("python", 1, tmp_path) == [("2024-06", 2)]